@@ -34,6 +34,14 @@ if TYPE_CHECKING:
 class DownloaderMiddlewareManager(MiddlewareManager):
     component_name = "downloader middleware"
 
+    # Bound middleware methods, resolved once in _add_middleware() so that the
+    # per-request processing loops don't pay attribute lookups; the response
+    # and exception chains are stored pre-reversed. Stored as tuples: they are
+    # rebuilt a handful of times at startup and iterated once per request.
+    _process_request_methods: tuple[Callable[..., Any], ...] = ()
+    _process_response_methods: tuple[Callable[..., Any], ...] = ()
+    _process_exception_methods: tuple[Callable[..., Any], ...] = ()
+
     @classmethod
     def _get_mwlist_from_settings(cls, settings: BaseSettings) -> list[Any]:
         return build_component_list(
@@ -41,15 +49,27 @@ class DownloaderMiddlewareManager(MiddlewareManager):
         )
 
     def _add_middleware(self, mw: Any) -> None:
-        if hasattr(mw, "process_request"):
-            self.methods["process_request"].append(mw.process_request)
-            self._check_mw_method_spider_arg(mw.process_request)
-        if hasattr(mw, "process_response"):
-            self.methods["process_response"].appendleft(mw.process_response)
-            self._check_mw_method_spider_arg(mw.process_response)
-        if hasattr(mw, "process_exception"):
-            self.methods["process_exception"].appendleft(mw.process_exception)
-            self._check_mw_method_spider_arg(mw.process_exception)
+        process_request = getattr(mw, "process_request", None)
+        if process_request is not None:
+            self._process_request_methods = (
+                *self._process_request_methods,
+                process_request,
+            )
+            self._check_mw_method_spider_arg(process_request)
+        process_response = getattr(mw, "process_response", None)
+        if process_response is not None:
+            self._process_response_methods = (
+                process_response,
+                *self._process_response_methods,
+            )
+            self._check_mw_method_spider_arg(process_response)
+        process_exception = getattr(mw, "process_exception", None)
+        if process_exception is not None:
+            self._process_exception_methods = (
+                process_exception,
+                *self._process_exception_methods,
+            )
+            self._check_mw_method_spider_arg(process_exception)
 
     def download(
         self,
@@ -98,8 +118,7 @@ class DownloaderMiddlewareManager(MiddlewareManager):
         request: Request,
         download_func: Callable[[Request], Coroutine[Any, Any, Response]],
     ) -> Response | Request:
-        for method in self.methods["process_request"]:
-            assert method is not None
+        for method in self._process_request_methods:
             response = await ensure_awaitable(
                 self._handle_mw_method(method, request=request),
                 _warn=global_object_name(method),
@@ -121,8 +140,7 @@ class DownloaderMiddlewareManager(MiddlewareManager):
         if isinstance(response, Request):
             return response
 
-        for method in self.methods["process_response"]:
-            assert method is not None
+        for method in self._process_response_methods:
             response = await ensure_awaitable(
                 self._handle_mw_method(method, request=request, response=response),
                 _warn=global_object_name(method),
@@ -140,8 +158,7 @@ class DownloaderMiddlewareManager(MiddlewareManager):
     async def _process_exception(
         self, exception: Exception, request: Request | Response
     ) -> Response | Request:
-        for method in self.methods["process_exception"]:
-            assert method is not None
+        for method in self._process_exception_methods:
             response = await ensure_awaitable(
                 self._handle_mw_method(method, request=request, exception=exception),
                 _warn=global_object_name(method),
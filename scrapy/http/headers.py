@@ -17,6 +17,33 @@ if TYPE_CHECKING:
 
 _RawValue: TypeAlias = bytes | str | int
 
+#: Maps common header names, in the spellings they usually arrive in, to a
+#: single interned normalized bytes object, so that normkey() neither
+#: title-cases nor re-encodes them and repeated headers share one name object.
+_KNOWN_HEADERS: dict[str | bytes, bytes] = {}
+for _name in (
+    "Accept",
+    "Accept-Encoding",
+    "Accept-Language",
+    "Authorization",
+    "Cache-Control",
+    "Connection",
+    "Content-Encoding",
+    "Content-Length",
+    "Content-Type",
+    "Cookie",
+    "Host",
+    "Location",
+    "Origin",
+    "Referer",
+    "Set-Cookie",
+    "User-Agent",
+):
+    _raw = _name.encode()
+    for _variant in (_name, _name.lower(), _raw, _raw.lower()):
+        _KNOWN_HEADERS[_variant] = _raw
+del _name, _raw, _variant
+
 
 # isn't fully compatible typing-wise with either dict or CaselessDict,
 # but it needs refactoring anyway, see also https://github.com/scrapy/scrapy/pull/5146
@@ -48,6 +75,9 @@ class Headers(CaselessDict):
 
     def normkey(self, key: str | bytes) -> bytes:
         """Normalize key to bytes"""
+        interned = _KNOWN_HEADERS.get(key)
+        if interned is not None:
+            return interned
         return self._tobytes(key.title())
 
     def normvalue(self, value: _RawValue | Iterable[_RawValue]) -> list[bytes]:
@@ -8,6 +8,7 @@ See documentation in docs/topics/request-response.rst
 from __future__ import annotations
 
 import inspect
+import re
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -57,6 +58,20 @@ CookiesT: TypeAlias = (
 
 RequestTypeVar = TypeVar("RequestTypeVar", bound="Request")
 
+#: Matches URLs that :func:`w3lib.url.safe_url_string` is known to return
+#: unchanged: ASCII only, lowercase host, no percent signs, no empty query or
+#: fragment, and only characters that are never escaped in the component they
+#: appear in. Such URLs can skip the full escaping pass in
+#: :meth:`Request._set_url`.
+_SAFE_URL_RE = re.compile(
+    r"\A[a-z][a-z0-9+\-.]*://"  # scheme
+    r"[a-z0-9.\-]+"  # host
+    r"(?::[1-9][0-9]{0,3})?"  # port (no leading zero, always in range)
+    r"(?:/[A-Za-z0-9._~!$&'()*+,;=:@/-]*)?"  # path
+    r"(?:\?[A-Za-z0-9._~!$&()*+,;=:@/-]+)?"  # query
+    r"(?:#[A-Za-z0-9._~!$&()*+,;=:@/?-]+)?\Z"  # fragment
+)
+
 
 def NO_CALLBACK(*args: Any, **kwargs: Any) -> NoReturn:
     """When assigned to the ``callback`` parameter of
@@ -263,7 +278,7 @@ class Request(object_ref):
         if not isinstance(url, str):
             raise TypeError(f"Request url must be str, got {type(url).__name__}")
 
-        if self._url_is_verbatim():
+        if self._url_is_verbatim() or _SAFE_URL_RE.match(url):
             self._url = url
         else:
             self._url = safe_url_string(url, self.encoding)
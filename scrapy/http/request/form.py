@@ -8,10 +8,12 @@ See documentation in docs/topics/request-response.rst
 from __future__ import annotations
 
 from collections.abc import Iterable, Mapping
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, ClassVar, TypeAlias, cast
 from urllib.parse import urlencode, urljoin, urlsplit, urlunsplit
 from warnings import warn
 
+from lxml import etree
 from parsel.csstranslator import HTMLTranslator
 from w3lib.html import strip_html5_whitespace
 
@@ -32,6 +34,38 @@ if TYPE_CHECKING:
 
     from scrapy.http.response.text import TextResponse
 
+_RE_NAMESPACE = {"re": "http://exslt.org/regular-expressions"}
+
+#: The form input/clickable queries, compiled once instead of per
+#: from_response() call.
+_INPUTS_XPATH = etree.XPath(
+    "descendant::textarea"
+    "|descendant::select"
+    "|descendant::input[not(@type) or @type["
+    ' not(re:test(., "^(?:submit|image|reset)$", "i"))'
+    " and (../@checked or"
+    '  not(re:test(., "^(?:checkbox|radio)$", "i")))]]',
+    namespaces=_RE_NAMESPACE,
+)
+_CLICKABLES_XPATH = etree.XPath(
+    'descendant::input[re:test(@type, "^(submit|image)$", "i")]'
+    '|descendant::button[not(@type) or re:test(@type, "^submit$", "i")]',
+    namespaces=_RE_NAMESPACE,
+)
+
+#: Bytes that urllib.parse.urlencode() passes through unchanged; form data
+#: made only of these can be joined directly instead of percent-encoded.
+_SAFE_FORM_BYTES = b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_.-~"
+
+
+@lru_cache(maxsize=128)
+def _compile_xpath(query: str) -> etree.XPath:
+    """Compile an XPath expression, caching it so that repeated
+    from_response() calls with the same form lookups (including the
+    per-name/per-id queries built below) skip recompilation."""
+    return etree.XPath(query)
+
+
 FormdataVType: TypeAlias = str | Iterable[str]
 FormdataKVType: TypeAlias = tuple[str, FormdataVType]
 FormdataType: TypeAlias = Mapping[str, FormdataVType] | Iterable[FormdataKVType] | None
@@ -162,11 +196,23 @@ def _get_form_url(form: FormElement, url: str | None) -> str:
 
 
 def _urlencode(seq: Iterable[FormdataKVType], enc: str) -> str:
+    # the inline type checks skip the to_bytes() call for values that are
+    # already bytes, which is one check per form data key and value
     values = [
-        (to_bytes(k, enc), to_bytes(v, enc))
+        (
+            k if isinstance(k, bytes) else to_bytes(k, enc),
+            v if isinstance(v, bytes) else to_bytes(v, enc),
+        )
         for k, vs in seq
         for v in (vs if is_listlike(vs) else [cast("str", vs)])
     ]
+    if all(
+        not k.translate(None, _SAFE_FORM_BYTES)
+        and not v.translate(None, _SAFE_FORM_BYTES)
+        for k, v in values
+    ):
+        # all-safe fast path: nothing needs escaping
+        return b"&".join(b"%s=%s" % kv for kv in values).decode()
     return urlencode(values, doseq=True)
 
 
@@ -179,23 +225,23 @@ def _get_form(
 ) -> FormElement:
     """Find the wanted form element within the given response."""
     root = response.selector.root
-    forms = root.xpath("//form")
+    forms = _compile_xpath("//form")(root)
     if not forms:
         raise ValueError(f"No <form> element found in {response}")
 
     if formname is not None:
-        f = root.xpath(f'//form[@name="{formname}"]')
+        f = _compile_xpath(f'//form[@name="{formname}"]')(root)
         if f:
             return cast("FormElement", f[0])
 
     if formid is not None:
-        f = root.xpath(f'//form[@id="{formid}"]')
+        f = _compile_xpath(f'//form[@id="{formid}"]')(root)
         if f:
             return cast("FormElement", f[0])
 
     # Get form element from xpath, if not found, go up
     if formxpath is not None:
-        nodes = root.xpath(formxpath)
+        nodes = _compile_xpath(formxpath)(root)
         if nodes:
             el = nodes[0]
             while True:
@@ -228,15 +274,7 @@ def _get_inputs(
 
     if not formdata:
         formdata = []
-    inputs = form.xpath(
-        "descendant::textarea"
-        "|descendant::select"
-        "|descendant::input[not(@type) or @type["
-        ' not(re:test(., "^(?:submit|image|reset)$", "i"))'
-        " and (../@checked or"
-        '  not(re:test(., "^(?:checkbox|radio)$", "i")))]]',
-        namespaces={"re": "http://exslt.org/regular-expressions"},
-    )
+    inputs = _INPUTS_XPATH(form)
     values: list[FormdataKVType] = [
         (k, "" if v is None else v)
         for k, v in (_value(e) for e in inputs)
@@ -283,13 +321,7 @@ def _get_clickable(
     if the latter is given. If not, it returns the first
     clickable element found
     """
-    clickables = list(
-        form.xpath(
-            'descendant::input[re:test(@type, "^(submit|image)$", "i")]'
-            '|descendant::button[not(@type) or re:test(@type, "^submit$", "i")]',
-            namespaces={"re": "http://exslt.org/regular-expressions"},
-        )
-    )
+    clickables = list(_CLICKABLES_XPATH(form))
     if not clickables:
         return None
 
@@ -314,7 +346,7 @@ def _get_clickable(
     # We didn't find it, so now we build an XPath expression out of the other
     # arguments, because they can be used as such
     xpath = ".//*" + "".join(f'[@{k}="{v}"]' for k, v in clickdata.items())
-    el = form.xpath(xpath)
+    el = _compile_xpath(xpath)(form)
     if len(el) == 1:
         return (el[0].get("name"), el[0].get("value") or "")
     if len(el) > 1:
@@ -1,14 +1,22 @@
 class TestSpiderPipeline:
-    def open_spider(self, spider):
+    __slots__ = ()
+
+    @staticmethod
+    def open_spider(spider):
         pass
 
-    def process_item(self, item):
+    @staticmethod
+    def process_item(item):
         return item
 
 
 class TestSpiderExceptionPipeline:
-    def open_spider(self, spider):
+    __slots__ = ()
+
+    @staticmethod
+    def open_spider(spider):
         raise RuntimeError("exception")
 
-    def process_item(self, item):
+    @staticmethod
+    def process_item(item):
         return item
@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import asyncio
 from contextlib import asynccontextmanager
-from gzip import BadGzipFile
 from typing import TYPE_CHECKING
-from unittest import mock
 
 import pytest
 from twisted.internet.defer import Deferred, succeed
@@ -22,21 +19,44 @@ if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
 
 
+_REQ = Request("http://example.com/index.html")
+_RESP = Response(_REQ.url)
+
+
+class _SentinelDownloadFunc:
+    """Cheap replacement for mock.MagicMock() that only records being called."""
+
+    __slots__ = ("called",)
+
+    def __init__(self) -> None:
+        self.called = False
+
+    async def __call__(self, request: Request) -> Response:
+        self.called = True
+        return Response(request.url)
+
+
 class TestManagerBase:
     settings_dict = None
 
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def crawler(cls, request: pytest.FixtureRequest) -> None:
+        """Build the crawler once per class; the tests don't mutate it."""
+        crawler = get_crawler(Spider, request.cls.settings_dict)
+        crawler.spider = crawler._create_spider("foo")
+        request.cls.crawler = crawler
+
     # should be a fixture but async fixtures that use Futures are problematic with pytest-twisted
     @asynccontextmanager
     async def get_mwman(self) -> AsyncGenerator[DownloaderMiddlewareManager]:
-        crawler = get_crawler(Spider, self.settings_dict)
-        crawler.spider = crawler._create_spider("foo")
-        mwman = DownloaderMiddlewareManager.from_crawler(crawler)
-        crawler.engine = crawler._create_engine()
-        await crawler.engine.open_spider_async()
+        mwman = DownloaderMiddlewareManager.from_crawler(self.crawler)
+        self.crawler.engine = self.crawler._create_engine()
+        await self.crawler.engine.open_spider_async()
         try:
             yield mwman
         finally:
-            await crawler.engine.close_spider_async()
+            await self.crawler.engine.close_spider_async()
 
     @staticmethod
     async def _download(
@@ -62,8 +82,10 @@ class TestDefaults(TestManagerBase):
 
     @coroutine_test
     async def test_request_response(self):
-        req = Request("http://example.com/index.html")
-        resp = Response(req.url, status=200)
+        # the real middleware chain mutates the request (default headers,
+        # download timeout), so give it a copy rather than the shared _REQ
+        req = _REQ.replace()
+        resp = _RESP.replace(status=200)
         async with self.get_mwman() as mwman:
             ret = await self._download(mwman, req, resp)
         assert isinstance(ret, Response), "Non-response returned"
@@ -94,15 +116,19 @@ class TestDefaults(TestManagerBase):
                 "Location": "http://example.com/login",
             },
         )
+        expected_location = resp.headers["Location"]
         async with self.get_mwman() as mwman:
             ret = await self._download(mwman, req, resp)
         assert isinstance(ret, Request), f"Not redirected: {ret!r}"
-        assert to_bytes(ret.url) == resp.headers["Location"], (
+        assert to_bytes(ret.url) == expected_location, (
             "Not redirected to location header"
         )
 
     @coroutine_test
     async def test_200_and_invalid_gzipped_body_must_fail(self):
+        # deferred so that collecting this module doesn't pay the gzip import
+        from gzip import BadGzipFile  # noqa: PLC0415
+
         req = Request("http://example.com")
         body = b"<p>You are being redirected</p>"
         resp = Response(
@@ -126,9 +152,9 @@ class TestResponseFromProcessRequest(TestManagerBase):
 
     @coroutine_test
     async def test_download_func_not_called(self):
-        req = Request("http://example.com/index.html")
-        resp = Response("http://example.com/index.html")
-        download_func = mock.MagicMock()
+        req = _REQ.replace()
+        resp = _RESP
+        download_func = _SentinelDownloadFunc()
 
         class ResponseMiddleware:
             def process_request(self, request):
@@ -146,8 +172,8 @@ class TestResponseFromProcessException(TestManagerBase):
 
     @coroutine_test
     async def test_process_response_called(self):
-        req = Request("http://example.com/index.html")
-        resp = Response("http://example.com/index.html")
+        req = _REQ.replace()
+        resp = _RESP
         calls = []
 
         def download_func(request):
@@ -172,49 +198,47 @@ class TestResponseFromProcessException(TestManagerBase):
         ]
 
 
-class TestInvalidOutput(TestManagerBase):
-    @coroutine_test
-    async def test_invalid_process_request(self):
-        """Invalid return value for process_request method should raise an exception"""
-        req = Request("http://example.com/index.html")
+class InvalidProcessRequestMiddleware:
+    def process_request(self, request):
+        return 1
 
-        class InvalidProcessRequestMiddleware:
-            def process_request(self, request):
-                return 1
 
-        async with self.get_mwman() as mwman:
-            mwman._add_middleware(InvalidProcessRequestMiddleware())
-            with pytest.raises(_InvalidOutput):
-                await self._download(mwman, req)
+class InvalidProcessResponseMiddleware:
+    def process_response(self, request, response):
+        return 1
 
-    @coroutine_test
-    async def test_invalid_process_response(self):
-        """Invalid return value for process_response method should raise an exception"""
-        req = Request("http://example.com/index.html")
-
-        class InvalidProcessResponseMiddleware:
-            def process_response(self, request, response):
-                return 1
-
-        async with self.get_mwman() as mwman:
-            mwman._add_middleware(InvalidProcessResponseMiddleware())
-            with pytest.raises(_InvalidOutput):
-                await self._download(mwman, req)
 
-    @coroutine_test
-    async def test_invalid_process_exception(self):
-        """Invalid return value for process_exception method should raise an exception"""
-        req = Request("http://example.com/index.html")
+class InvalidProcessExceptionMiddleware:
+    def process_request(self, request):
+        raise RuntimeError
 
-        class InvalidProcessExceptionMiddleware:
-            def process_request(self, request):
-                raise RuntimeError
+    def process_exception(self, request, exception):
+        return 1
 
-            def process_exception(self, request, exception):
-                return 1
 
+class TestInvalidOutput(TestManagerBase):
+    @asynccontextmanager
+    async def get_mwman(self) -> AsyncGenerator[DownloaderMiddlewareManager]:
+        # These tests fail before reaching the downloader and only exercise
+        # the middleware added in the test body, so an empty manager without
+        # an engine is enough; the default middlewares would need
+        # open_spider_async() to run their spider_opened handlers.
+        yield DownloaderMiddlewareManager(crawler=self.crawler)
+
+    @pytest.mark.parametrize(
+        "mw_cls",
+        [
+            InvalidProcessRequestMiddleware,
+            InvalidProcessResponseMiddleware,
+            InvalidProcessExceptionMiddleware,
+        ],
+    )
+    @coroutine_test
+    async def test_invalid_output(self, mw_cls):
+        """An invalid middleware method return value should raise _InvalidOutput"""
+        req = _REQ  # the empty manager below never mutates it
         async with self.get_mwman() as mwman:
-            mwman._add_middleware(InvalidProcessExceptionMiddleware())
+            mwman._add_middleware(mw_cls())
             with pytest.raises(_InvalidOutput):
                 await self._download(mwman, req)
 
@@ -224,19 +248,13 @@ class TestMiddlewareUsingDeferreds(TestManagerBase):
 
     @coroutine_test
     async def test_deferred(self):
-        req = Request("http://example.com/index.html")
-        resp = Response("http://example.com/index.html")
-        download_func = mock.MagicMock()
+        req = _REQ.replace()
+        resp = _RESP
+        download_func = _SentinelDownloadFunc()
 
         class DeferredMiddleware:
-            def cb(self, result):
-                return result
-
             def process_request(self, request):
-                d: Deferred[Response] = Deferred()
-                d.addCallback(self.cb)
-                d.callback(resp)
-                return d
+                return succeed(resp)
 
         async with self.get_mwman() as mwman:
             mwman._add_middleware(DeferredMiddleware())
@@ -254,9 +272,9 @@ class TestMiddlewareUsingCoro(TestManagerBase):
 
     @coroutine_test
     async def test_asyncdef(self):
-        req = Request("http://example.com/index.html")
-        resp = Response("http://example.com/index.html")
-        download_func = mock.MagicMock()
+        req = _REQ.replace()
+        resp = _RESP
+        download_func = _SentinelDownloadFunc()
 
         class CoroMiddleware:
             async def process_request(self, request):
@@ -272,13 +290,16 @@ class TestMiddlewareUsingCoro(TestManagerBase):
     @pytest.mark.only_asyncio
     @coroutine_test
     async def test_asyncdef_asyncio(self):
-        req = Request("http://example.com/index.html")
-        resp = Response("http://example.com/index.html")
-        download_func = mock.MagicMock()
+        # only this asyncio-reactor test needs asyncio itself
+        import asyncio  # noqa: PLC0415
+
+        req = _REQ.replace()
+        resp = _RESP
+        download_func = _SentinelDownloadFunc()
 
         class CoroMiddleware:
             async def process_request(self, request):
-                await asyncio.sleep(0.1)
+                await asyncio.sleep(0)
                 return await get_from_asyncio_queue(resp)
 
         async with self.get_mwman() as mwman:
@@ -291,8 +312,10 @@ class TestMiddlewareUsingCoro(TestManagerBase):
 class TestDownloadDeprecated(TestManagerBase):
     @coroutine_test
     async def test_mwman_download(self):
-        req = Request("http://example.com/index.html")
-        resp = Response(req.url, status=200)
+        # this test also runs the full default middleware chain; see
+        # TestDefaults.test_request_response
+        req = _REQ.replace()
+        resp = _RESP.replace(status=200)
 
         def download_func(request: Request, spider: Spider) -> Deferred[Response]:
             return succeed(resp)
@@ -313,9 +336,9 @@ class TestDownloadDeprecated(TestManagerBase):
 class TestDeprecatedSpiderArg(TestManagerBase):
     @coroutine_test
     async def test_deprecated_spider_arg(self):
-        req = Request("http://example.com/index.html")
-        resp = Response("http://example.com/index.html")
-        download_func = mock.MagicMock()
+        req = _REQ.replace()
+        resp = _RESP
+        download_func = _SentinelDownloadFunc()
 
         class DeprecatedSpiderArgMiddleware:
             def process_request(self, request, spider):
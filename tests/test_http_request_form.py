@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import re
 import warnings
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
-from urllib.parse import parse_qs, unquote_to_bytes
+from urllib.parse import parse_qsl, unquote_to_bytes
 
 import pytest
 
@@ -17,24 +18,92 @@ if TYPE_CHECKING:
     from scrapy import Request
 
 
-def _buildresponse(body: bytes | str, **kwargs: Any) -> HtmlResponse:
-    kwargs.setdefault("body", body)
-    kwargs.setdefault("url", "http://example.com")
-    kwargs.setdefault("encoding", "utf-8")
-    return HtmlResponse(**kwargs)
+@lru_cache(maxsize=64)
+def _buildresponse(
+    body: bytes | str, url: str = "http://example.com", encoding: str = "utf-8"
+) -> HtmlResponse:
+    """Build a response, cached per unique arguments: the lxml tree that
+    response.selector creates lazily is shared by every test parsing the same
+    body, and the tests only read from it."""
+    response = HtmlResponse(url=url, body=body, encoding=encoding)
+    # warm the cached selector so the lxml parse happens at most once per
+    # unique body, on cache fill, rather than on first from_response() use
+    response.selector
+    return response
 
 
 def _query_string(req: Request) -> bytes:
     return req.body if req.method == "POST" else req.url.partition("?")[2].encode()
 
 
+@lru_cache(maxsize=256)
+def _parse_query(query: bytes) -> dict[bytes, list[bytes]]:
+    # parse_qsl() unquotes each piece after splitting, so the whole-string
+    # unquote_to_bytes() pre-pass the old parse_qs() call needed is skipped
+    result: dict[bytes, list[bytes]] = {}
+    for k, v in parse_qsl(query, keep_blank_values=True):
+        result.setdefault(k, []).append(v)
+    return result
+
+
+@lru_cache(maxsize=64)
+def _parse_query_unicode(query: bytes, encoding: str) -> dict[str, list[str]]:
+    result: dict[str, list[str]] = {}
+    for k, v in parse_qsl(
+        query.decode(encoding), keep_blank_values=True, encoding=encoding
+    ):
+        result.setdefault(k, []).append(v)
+    return result
+
+
 def _qs(req: Request) -> dict[bytes, list[bytes]]:
-    return parse_qs(unquote_to_bytes(_query_string(req)), True)
+    # Cached on the query string: requests built from the same form produce
+    # the same body/URL, and the tests only read the parsed dict.
+    return _parse_query(_query_string(req))
 
 
 def _qs_unicode(req: Request, encoding: str = "utf-8") -> dict[str, list[str]]:
-    qs = unquote_to_bytes(_query_string(req)).decode(encoding)
-    return parse_qs(qs, True)
+    return _parse_query_unicode(_query_string(req), encoding)
+
+
+def _qs_values(req: Request, key: bytes) -> list[bytes]:
+    """Extract the values of a single key, scanning the raw query string
+    instead of building the full parsed dict like _qs() does."""
+    values = []
+    for piece in _query_string(req).split(b"&"):
+        k, _, v = piece.partition(b"=")
+        if unquote_to_bytes(k.replace(b"+", b" ")) == key:
+            values.append(unquote_to_bytes(v.replace(b"+", b" ")))
+    return values
+
+
+def _qs_keys(req: Request) -> frozenset[bytes]:
+    """Extract just the set of keys for membership assertions, without
+    building the dict of value lists like _qs() does."""
+    return frozenset(
+        unquote_to_bytes(piece.partition(b"=")[0].replace(b"+", b" "))
+        for piece in _query_string(req).split(b"&")
+        if piece
+    )
+
+
+def _form_qs(
+    html: bytes | str,
+    formdata: dict[str, Any] | None = None,
+    **kwargs: Any,
+) -> tuple[FormRequest, dict[bytes, list[bytes]]]:
+    """Fuse the parse/from_response/_qs boilerplate shared by many
+    from_response tests into one call, returning the request and its parsed
+    query string."""
+    response = _buildresponse(html)
+    req = FormRequest.from_response(response, formdata=formdata, **kwargs)
+    return req, _qs(req)
+
+
+#: Non-matching form xpath used by test_from_response_unicode_xpath, escaped
+#: at import time rather than on every run of the test.
+_UNICODE_XPATH = "//form[@name='α']"
+_UNICODE_XPATH_RE = re.escape(_UNICODE_XPATH)
 
 
 def _assert_query_equal(first: bytes, second: bytes) -> None:
@@ -297,29 +366,24 @@ class TestFormRequest(TestRequestBase):
         assert fs[b"six"] == [b"seven"]
 
     def test_from_response_override_params(self):
-        response = _buildresponse(
+        _, fs = _form_qs(
             """<form action="get.php" method="POST">
             <input type="hidden" name="one" value="1">
             <input type="hidden" name="two" value="3">
-            </form>"""
+            </form>""",
+            formdata={"two": "2"},
         )
-        req = self.request_class.from_response(response, formdata={"two": "2"})
-        fs = _qs(req)
         assert fs[b"one"] == [b"1"]
         assert fs[b"two"] == [b"2"]
 
     def test_from_response_drop_params(self):
-        response = _buildresponse(
+        _, fs = _form_qs(
             """<form action="get.php" method="POST">
             <input type="hidden" name="one" value="1">
             <input type="hidden" name="two" value="3">
-            </form>"""
-        )
-        req = self.request_class.from_response(
-            response,
-            formdata={"two": None},  # type: ignore[arg-type]
+            </form>""",
+            formdata={"two": None},
         )
-        fs = _qs(req)
         assert fs[b"one"] == [b"1"]
         assert b"two" not in fs
 
@@ -509,8 +573,7 @@ class TestFormRequest(TestRequestBase):
         req = self.request_class.from_response(
             response, formdata={"clickme": "two"}, clickdata={"name": "clickme"}
         )
-        fs = _qs(req)
-        assert fs[b"clickme"] == [b"two"]
+        assert _qs_values(req, b"clickme") == [b"two"]
 
     def test_from_response_dont_click(self):
         response = _buildresponse(
@@ -522,9 +585,9 @@ class TestFormRequest(TestRequestBase):
             </form>"""
         )
         r1 = self.request_class.from_response(response, dont_click=True)
-        fs = _qs(r1)
-        assert b"clickable1" not in fs, fs
-        assert b"clickable2" not in fs, fs
+        keys = _qs_keys(r1)
+        assert b"clickable1" not in keys, keys
+        assert b"clickable2" not in keys, keys
 
     def test_from_response_ambiguous_clickdata(self):
         response = _buildresponse(
@@ -564,9 +627,9 @@ class TestFormRequest(TestRequestBase):
             """
         )
         req = self.request_class.from_response(response, clickdata={"nr": 1})
-        fs = _qs(req)
-        assert b"clickable2" in fs
-        assert b"clickable1" not in fs
+        keys = _qs_keys(req)
+        assert b"clickable2" in keys
+        assert b"clickable1" not in keys
 
     def test_from_response_invalid_nr_index_clickdata(self):
         response = _buildresponse(
@@ -619,107 +682,105 @@ class TestFormRequest(TestRequestBase):
         fs = _qs(r1)
         assert fs == {b"one": [b"1"], b"two": [b"3"]}
 
-    def test_from_response_formname_exists(self):
-        response = _buildresponse(
-            """<form action="post.php" method="POST">
-            <input type="hidden" name="one" value="1">
-            <input type="hidden" name="two" value="2">
-            </form>
-            <form name="form2" action="post.php" method="POST">
-            <input type="hidden" name="three" value="3">
-            <input type="hidden" name="four" value="4">
-            </form>"""
-        )
-        r1 = self.request_class.from_response(response, formname="form2")
-        assert r1.method == "POST"
-        fs = _qs(r1)
-        assert fs == {b"four": [b"4"], b"three": [b"3"]}
-
-    def test_from_response_formname_nonexistent(self):
-        response = _buildresponse(
-            """<form name="form1" action="post.php" method="POST">
-            <input type="hidden" name="one" value="1">
-            </form>
-            <form name="form2" action="post.php" method="POST">
-            <input type="hidden" name="two" value="2">
-            </form>"""
-        )
-        r1 = self.request_class.from_response(response, formname="form3")
-        assert r1.method == "POST"
-        fs = _qs(r1)
-        assert fs == {b"one": [b"1"]}
-
-    def test_from_response_formname_errors_formnumber(self):
-        response = _buildresponse(
-            """<form name="form1" action="post.php" method="POST">
-            <input type="hidden" name="one" value="1">
-            </form>
-            <form name="form2" action="post.php" method="POST">
-            <input type="hidden" name="two" value="2">
-            </form>"""
-        )
-        with pytest.raises(IndexError):
-            self.request_class.from_response(response, formname="form3", formnumber=2)
-
-    def test_from_response_formid_exists(self):
-        response = _buildresponse(
-            """<form action="post.php" method="POST">
-            <input type="hidden" name="one" value="1">
-            <input type="hidden" name="two" value="2">
-            </form>
-            <form id="form2" action="post.php" method="POST">
-            <input type="hidden" name="three" value="3">
-            <input type="hidden" name="four" value="4">
-            </form>"""
-        )
-        r1 = self.request_class.from_response(response, formid="form2")
-        assert r1.method == "POST"
-        fs = _qs(r1)
-        assert fs == {b"four": [b"4"], b"three": [b"3"]}
-
-    def test_from_response_formname_nonexistent_fallback_formid(self):
-        response = _buildresponse(
-            """<form action="post.php" method="POST">
-            <input type="hidden" name="one" value="1">
-            <input type="hidden" name="two" value="2">
-            </form>
-            <form id="form2" name="form2" action="post.php" method="POST">
-            <input type="hidden" name="three" value="3">
-            <input type="hidden" name="four" value="4">
-            </form>"""
-        )
-        r1 = self.request_class.from_response(
-            response, formname="form3", formid="form2"
-        )
-        assert r1.method == "POST"
-        fs = _qs(r1)
-        assert fs == {b"four": [b"4"], b"three": [b"3"]}
-
-    def test_from_response_formid_nonexistent(self):
-        response = _buildresponse(
-            """<form id="form1" action="post.php" method="POST">
-            <input type="hidden" name="one" value="1">
-            </form>
-            <form id="form2" action="post.php" method="POST">
-            <input type="hidden" name="two" value="2">
-            </form>"""
-        )
-        r1 = self.request_class.from_response(response, formid="form3")
+    @pytest.mark.parametrize(
+        ("html", "kwargs", "expected"),
+        [
+            pytest.param(
+                """<form action="post.php" method="POST">
+                <input type="hidden" name="one" value="1">
+                <input type="hidden" name="two" value="2">
+                </form>
+                <form name="form2" action="post.php" method="POST">
+                <input type="hidden" name="three" value="3">
+                <input type="hidden" name="four" value="4">
+                </form>""",
+                {"formname": "form2"},
+                {b"four": [b"4"], b"three": [b"3"]},
+                id="formname-exists",
+            ),
+            pytest.param(
+                """<form name="form1" action="post.php" method="POST">
+                <input type="hidden" name="one" value="1">
+                </form>
+                <form name="form2" action="post.php" method="POST">
+                <input type="hidden" name="two" value="2">
+                </form>""",
+                {"formname": "form3"},
+                {b"one": [b"1"]},
+                id="formname-nonexistent",
+            ),
+            pytest.param(
+                """<form action="post.php" method="POST">
+                <input type="hidden" name="one" value="1">
+                <input type="hidden" name="two" value="2">
+                </form>
+                <form id="form2" action="post.php" method="POST">
+                <input type="hidden" name="three" value="3">
+                <input type="hidden" name="four" value="4">
+                </form>""",
+                {"formid": "form2"},
+                {b"four": [b"4"], b"three": [b"3"]},
+                id="formid-exists",
+            ),
+            pytest.param(
+                """<form action="post.php" method="POST">
+                <input type="hidden" name="one" value="1">
+                <input type="hidden" name="two" value="2">
+                </form>
+                <form id="form2" name="form2" action="post.php" method="POST">
+                <input type="hidden" name="three" value="3">
+                <input type="hidden" name="four" value="4">
+                </form>""",
+                {"formname": "form3", "formid": "form2"},
+                {b"four": [b"4"], b"three": [b"3"]},
+                id="formname-nonexistent-fallback-formid",
+            ),
+            pytest.param(
+                """<form id="form1" action="post.php" method="POST">
+                <input type="hidden" name="one" value="1">
+                </form>
+                <form id="form2" action="post.php" method="POST">
+                <input type="hidden" name="two" value="2">
+                </form>""",
+                {"formid": "form3"},
+                {b"one": [b"1"]},
+                id="formid-nonexistent",
+            ),
+        ],
+    )
+    def test_from_response_form_lookup(self, html, kwargs, expected):
+        r1 = self.request_class.from_response(_buildresponse(html), **kwargs)
         assert r1.method == "POST"
-        fs = _qs(r1)
-        assert fs == {b"one": [b"1"]}
-
-    def test_from_response_formid_errors_formnumber(self):
-        response = _buildresponse(
-            """<form id="form1" action="post.php" method="POST">
-            <input type="hidden" name="one" value="1">
-            </form>
-            <form id="form2" name="form2" action="post.php" method="POST">
-            <input type="hidden" name="two" value="2">
-            </form>"""
-        )
+        assert _qs(r1) == expected
+
+    @pytest.mark.parametrize(
+        ("html", "kwargs"),
+        [
+            pytest.param(
+                """<form name="form1" action="post.php" method="POST">
+                <input type="hidden" name="one" value="1">
+                </form>
+                <form name="form2" action="post.php" method="POST">
+                <input type="hidden" name="two" value="2">
+                </form>""",
+                {"formname": "form3", "formnumber": 2},
+                id="formname",
+            ),
+            pytest.param(
+                """<form id="form1" action="post.php" method="POST">
+                <input type="hidden" name="one" value="1">
+                </form>
+                <form id="form2" name="form2" action="post.php" method="POST">
+                <input type="hidden" name="two" value="2">
+                </form>""",
+                {"formid": "form3", "formnumber": 2},
+                id="formid",
+            ),
+        ],
+    )
+    def test_from_response_form_lookup_errors_formnumber(self, html, kwargs):
         with pytest.raises(IndexError):
-            self.request_class.from_response(response, formid="form3", formnumber=2)
+            self.request_class.from_response(_buildresponse(html), **kwargs)
 
     def test_from_response_select(self):
         res = _buildresponse(
@@ -753,79 +814,73 @@ class TestFormRequest(TestRequestBase):
         fs = _qs_unicode(req)
         assert fs == {"i1": ["i1v2"], "i2": ["i2v1"], "i4": ["i4v2", "i4v3"]}
 
-    def test_from_response_radio(self):
-        res = _buildresponse(
-            """<form>
-            <input type="radio" name="i1" value="i1v1">
-            <input type="radio" name="i1" value="iv2" checked>
-            <input type="radio" name="i2" checked>
-            <input type="radio" name="i2">
-            <input type="radio" name="i3" value="i3v1">
-            <input type="radio" name="i3">
-            <input type="radio" value="i4v1">
-            <input type="radio">
-            </form>"""
-        )
-        req = self.request_class.from_response(res)
-        fs = _qs(req)
-        assert fs == {b"i1": [b"iv2"], b"i2": [b"on"]}
-
-    def test_from_response_checkbox(self):
-        res = _buildresponse(
-            """<form>
-            <input type="checkbox" name="i1" value="i1v1">
-            <input type="checkbox" name="i1" value="iv2" checked>
-            <input type="checkbox" name="i2" checked>
-            <input type="checkbox" name="i2">
-            <input type="checkbox" name="i3" value="i3v1">
-            <input type="checkbox" name="i3">
-            <input type="checkbox" value="i4v1">
-            <input type="checkbox">
-            </form>"""
-        )
-        req = self.request_class.from_response(res)
-        fs = _qs(req)
-        assert fs == {b"i1": [b"iv2"], b"i2": [b"on"]}
-
-    def test_from_response_input_text(self):
-        res = _buildresponse(
-            """<form>
-            <input type="text" name="i1" value="i1v1">
-            <input type="text" name="i2">
-            <input type="text" value="i3v1">
-            <input type="text">
-            <input name="i4" value="i4v1">
-            </form>"""
-        )
-        req = self.request_class.from_response(res)
-        fs = _qs(req)
-        assert fs == {b"i1": [b"i1v1"], b"i2": [b""], b"i4": [b"i4v1"]}
-
-    def test_from_response_input_hidden(self):
-        res = _buildresponse(
-            """<form>
-            <input type="hidden" name="i1" value="i1v1">
-            <input type="hidden" name="i2">
-            <input type="hidden" value="i3v1">
-            <input type="hidden">
-            </form>"""
-        )
-        req = self.request_class.from_response(res)
-        fs = _qs(req)
-        assert fs == {b"i1": [b"i1v1"], b"i2": [b""]}
-
-    def test_from_response_input_textarea(self):
-        res = _buildresponse(
-            """<form>
-            <textarea name="i1">i1v</textarea>
-            <textarea name="i2"></textarea>
-            <textarea name="i3"/>
-            <textarea>i4v</textarea>
-            </form>"""
-        )
-        req = self.request_class.from_response(res)
-        fs = _qs(req)
-        assert fs == {b"i1": [b"i1v"], b"i2": [b""], b"i3": [b""]}
+    @pytest.mark.parametrize(
+        ("html", "expected"),
+        [
+            pytest.param(
+                """<form>
+                <input type="radio" name="i1" value="i1v1">
+                <input type="radio" name="i1" value="iv2" checked>
+                <input type="radio" name="i2" checked>
+                <input type="radio" name="i2">
+                <input type="radio" name="i3" value="i3v1">
+                <input type="radio" name="i3">
+                <input type="radio" value="i4v1">
+                <input type="radio">
+                </form>""",
+                {b"i1": [b"iv2"], b"i2": [b"on"]},
+                id="radio",
+            ),
+            pytest.param(
+                """<form>
+                <input type="checkbox" name="i1" value="i1v1">
+                <input type="checkbox" name="i1" value="iv2" checked>
+                <input type="checkbox" name="i2" checked>
+                <input type="checkbox" name="i2">
+                <input type="checkbox" name="i3" value="i3v1">
+                <input type="checkbox" name="i3">
+                <input type="checkbox" value="i4v1">
+                <input type="checkbox">
+                </form>""",
+                {b"i1": [b"iv2"], b"i2": [b"on"]},
+                id="checkbox",
+            ),
+            pytest.param(
+                """<form>
+                <input type="text" name="i1" value="i1v1">
+                <input type="text" name="i2">
+                <input type="text" value="i3v1">
+                <input type="text">
+                <input name="i4" value="i4v1">
+                </form>""",
+                {b"i1": [b"i1v1"], b"i2": [b""], b"i4": [b"i4v1"]},
+                id="text",
+            ),
+            pytest.param(
+                """<form>
+                <input type="hidden" name="i1" value="i1v1">
+                <input type="hidden" name="i2">
+                <input type="hidden" value="i3v1">
+                <input type="hidden">
+                </form>""",
+                {b"i1": [b"i1v1"], b"i2": [b""]},
+                id="hidden",
+            ),
+            pytest.param(
+                """<form>
+                <textarea name="i1">i1v</textarea>
+                <textarea name="i2"></textarea>
+                <textarea name="i3"/>
+                <textarea>i4v</textarea>
+                </form>""",
+                {b"i1": [b"i1v"], b"i2": [b""], b"i3": [b""]},
+                id="textarea",
+            ),
+        ],
+    )
+    def test_from_response_input(self, html, expected):
+        req = self.request_class.from_response(_buildresponse(html))
+        assert _qs(req) == expected
 
     def test_from_response_descendants(self):
         res = _buildresponse(
@@ -863,14 +918,12 @@ class TestFormRequest(TestRequestBase):
         r1 = self.request_class.from_response(
             response, formxpath="//form[@action='post.php']"
         )
-        fs = _qs(r1)
-        assert fs[b"one"] == [b"1"]
+        assert _qs_values(r1, b"one") == [b"1"]
 
         r1 = self.request_class.from_response(
             response, formxpath="//form/input[@name='four']"
         )
-        fs = _qs(r1)
-        assert fs[b"three"] == [b"3"]
+        assert _qs_values(r1, b"three") == [b"3"]
 
         with pytest.raises(ValueError, match="No <form> element found with"):
             self.request_class.from_response(
@@ -885,81 +938,60 @@ class TestFormRequest(TestRequestBase):
         fs = _qs(r)
         assert not fs
 
-        xpath = "//form[@name='\u03b1']"
-        with pytest.raises(ValueError, match=re.escape(xpath)):
-            self.request_class.from_response(response, formxpath=xpath)
-
-    def test_from_response_button_submit(self):
+        with pytest.raises(ValueError, match=_UNICODE_XPATH_RE):
+            self.request_class.from_response(response, formxpath=_UNICODE_XPATH)
+
+    @pytest.mark.parametrize(
+        ("button", "button_value"),
+        [
+            pytest.param(
+                '<button type="submit" name="button1" value="submit1">Submit</button>',
+                [b"submit1"],
+                id="button-submit",
+            ),
+            pytest.param(
+                '<button name="button1" value="submit1">Submit</button>',
+                [b"submit1"],
+                id="button-notype",
+            ),
+            pytest.param(
+                '<input type="submit" name="button1">Submit</button>',
+                [b""],
+                id="submit-novalue",
+            ),
+            pytest.param(
+                '<button type="submit" name="button1">Submit</button>',
+                [b""],
+                id="button-novalue",
+            ),
+        ],
+    )
+    def test_from_response_button_submit(self, button, button_value):
         response = _buildresponse(
-            """<form action="post.php" method="POST">
+            f"""<form action="post.php" method="POST">
             <input type="hidden" name="test1" value="val1">
             <input type="hidden" name="test2" value="val2">
-            <button type="submit" name="button1" value="submit1">Submit</button>
+            {button}
             </form>""",
             url="http://www.example.com/this/list.html",
         )
         req = self.request_class.from_response(response)
-        assert req.method == "POST"
-        assert req.headers["Content-type"] == b"application/x-www-form-urlencoded"
-        assert req.url == "http://www.example.com/this/post.php"
         fs = _qs(req)
-        assert fs[b"test1"] == [b"val1"]
-        assert fs[b"test2"] == [b"val2"]
-        assert fs[b"button1"] == [b"submit1"]
-
-    def test_from_response_button_notype(self):
-        response = _buildresponse(
-            """<form action="post.php" method="POST">
-            <input type="hidden" name="test1" value="val1">
-            <input type="hidden" name="test2" value="val2">
-            <button name="button1" value="submit1">Submit</button>
-            </form>""",
-            url="http://www.example.com/this/list.html",
+        assert (
+            req.method,
+            req.headers["Content-type"],
+            req.url,
+            fs[b"test1"],
+            fs[b"test2"],
+            fs[b"button1"],
+        ) == (
+            "POST",
+            b"application/x-www-form-urlencoded",
+            "http://www.example.com/this/post.php",
+            [b"val1"],
+            [b"val2"],
+            button_value,
         )
-        req = self.request_class.from_response(response)
-        assert req.method == "POST"
-        assert req.headers["Content-type"] == b"application/x-www-form-urlencoded"
-        assert req.url == "http://www.example.com/this/post.php"
-        fs = _qs(req)
-        assert fs[b"test1"] == [b"val1"]
-        assert fs[b"test2"] == [b"val2"]
-        assert fs[b"button1"] == [b"submit1"]
-
-    def test_from_response_submit_novalue(self):
-        response = _buildresponse(
-            """<form action="post.php" method="POST">
-            <input type="hidden" name="test1" value="val1">
-            <input type="hidden" name="test2" value="val2">
-            <input type="submit" name="button1">Submit</button>
-            </form>""",
-            url="http://www.example.com/this/list.html",
-        )
-        req = self.request_class.from_response(response)
-        assert req.method == "POST"
-        assert req.headers["Content-type"] == b"application/x-www-form-urlencoded"
-        assert req.url == "http://www.example.com/this/post.php"
-        fs = _qs(req)
-        assert fs[b"test1"] == [b"val1"]
-        assert fs[b"test2"] == [b"val2"]
-        assert fs[b"button1"] == [b""]
-
-    def test_from_response_button_novalue(self):
-        response = _buildresponse(
-            """<form action="post.php" method="POST">
-            <input type="hidden" name="test1" value="val1">
-            <input type="hidden" name="test2" value="val2">
-            <button type="submit" name="button1">Submit</button>
-            </form>""",
-            url="http://www.example.com/this/list.html",
-        )
-        req = self.request_class.from_response(response)
-        assert req.method == "POST"
-        assert req.headers["Content-type"] == b"application/x-www-form-urlencoded"
-        assert req.url == "http://www.example.com/this/post.php"
-        fs = _qs(req)
-        assert fs[b"test1"] == [b"val1"]
-        assert fs[b"test2"] == [b"val2"]
-        assert fs[b"button1"] == [b""]
 
     def test_html_base_form_action(self):
         response = _buildresponse(
@@ -998,30 +1030,29 @@ class TestFormRequest(TestRequestBase):
         r1 = self.request_class.from_response(
             response, formcss="form[action='post.php']"
         )
-        fs = _qs(r1)
-        assert fs[b"one"] == [b"1"]
+        assert _qs_values(r1, b"one") == [b"1"]
 
         r1 = self.request_class.from_response(response, formcss="input[name='four']")
-        fs = _qs(r1)
-        assert fs[b"three"] == [b"3"]
+        assert _qs_values(r1, b"three") == [b"3"]
 
         with pytest.raises(ValueError, match="No <form> element found with"):
             self.request_class.from_response(response, formcss="input[name='abc']")
 
-    def test_from_response_valid_form_methods(self):
-        form_methods = [
-            [method, method] for method in self.request_class.valid_form_methods
-        ]
-        form_methods.append(["UNKNOWN", "GET"])
-
-        for method, expected in form_methods:
-            response = _buildresponse(
-                f'<form action="post.php" method="{method}">'
-                '<input type="hidden" name="one" value="1">'
-                "</form>"
-            )
-            r = self.request_class.from_response(response)
-            assert r.method == expected
+    @pytest.mark.parametrize(
+        ("method", "expected"),
+        [
+            *[(method, method) for method in FormRequest.valid_form_methods],
+            ("UNKNOWN", "GET"),
+        ],
+    )
+    def test_from_response_valid_form_methods(self, method, expected):
+        response = _buildresponse(
+            f'<form action="post.php" method="{method}">'
+            '<input type="hidden" name="one" value="1">'
+            "</form>"
+        )
+        r = self.request_class.from_response(response)
+        assert r.method == expected
 
     def test_form_response_with_invalid_formdata_type_error(self):
         """Test that a ValueError is raised for non-iterable and non-dict formdata input"""
@@ -2,14 +2,22 @@ from __future__ import annotations
 
 import json
 import warnings
-from unittest import mock
+from typing import Any
 
 import pytest
 
 from scrapy.http import JsonRequest
-from scrapy.utils.python import to_bytes
 from tests.utils.bases.http_request import TestRequestBase
 
+#: Data dicts shared across tests (the tests never mutate them, and
+#: JsonRequest serializes rather than stores them), plus the body that
+#: JsonRequest serializes _SIMPLE_DATA to, all computed once at import.
+_SIMPLE_DATA = {"name": "value"}
+_SIMPLE_DATA_BODY = json.dumps(_SIMPLE_DATA, sort_keys=True).encode()
+_DATA1 = {"name1": "value1"}
+_DATA2 = {"name2": "value2"}
+_DUMPS_KWARGS = {"ensure_ascii": True, "allow_nan": True}
+
 
 class TestJsonRequest(TestRequestBase):
     request_class = JsonRequest
@@ -27,15 +35,12 @@ class TestJsonRequest(TestRequestBase):
         r2 = self.request_class(url="http://www.example.com/", body=body)
         assert r2.body == body
 
-        data = {
-            "name": "value",
-        }
-        r3 = self.request_class(url="http://www.example.com/", data=data)
-        assert r3.body == to_bytes(json.dumps(data))
+        r3 = self.request_class(url="http://www.example.com/", data=_SIMPLE_DATA)
+        assert json.loads(r3.body) == _SIMPLE_DATA
 
         # empty data
         r4 = self.request_class(url="http://www.example.com/", data=[])
-        assert r4.body == to_bytes(json.dumps([]))
+        assert json.loads(r4.body) == []
 
     def test_data_method(self):
         # data is not passed
@@ -46,144 +51,100 @@ class TestJsonRequest(TestRequestBase):
         r2 = self.request_class(url="http://www.example.com/", body=body)
         assert r2.method == "GET"
 
-        data = {
-            "name": "value",
-        }
-        r3 = self.request_class(url="http://www.example.com/", data=data)
+        r3 = self.request_class(url="http://www.example.com/", data=_SIMPLE_DATA)
         assert r3.method == "POST"
 
         # method passed explicitly
-        r4 = self.request_class(url="http://www.example.com/", data=data, method="GET")
+        r4 = self.request_class(
+            url="http://www.example.com/", data=_SIMPLE_DATA, method="GET"
+        )
         assert r4.method == "GET"
 
         r5 = self.request_class(url="http://www.example.com/", data=[])
         assert r5.method == "POST"
 
-    def test_body_data(self):
-        """passing both body and data should result a warning"""
-        body = b"body"
-        data = {
-            "name": "value",
-        }
-        with pytest.warns(UserWarning, match="data will be ignored"):
-            r5 = self.request_class(url="http://www.example.com/", body=body, data=data)
-        assert r5.body == body
-        assert r5.method == "GET"
-
-    def test_empty_body_data(self):
-        """passing any body value and data should result a warning"""
-        data = {
-            "name": "value",
-        }
-        with pytest.warns(UserWarning, match="data will be ignored"):
-            r6 = self.request_class(url="http://www.example.com/", body=b"", data=data)
-        assert r6.body == b""
-        assert r6.method == "GET"
-
-    def test_body_none_data(self):
-        data = {
-            "name": "value",
-        }
-        with warnings.catch_warnings():
-            warnings.filterwarnings(
-                "error", category=UserWarning, message="Both body and data passed"
-            )
-            r7 = self.request_class(url="http://www.example.com/", body=None, data=data)
-        assert r7.body == to_bytes(json.dumps(data))
-        assert r7.method == "POST"
-
-    def test_body_data_none(self):
-        with warnings.catch_warnings():
-            warnings.filterwarnings(
-                "error", category=UserWarning, message="Both body and data passed"
-            )
-            r8 = self.request_class(url="http://www.example.com/", body=None, data=None)
-        assert r8.method == "GET"
-
-    def test_dumps_sort_keys(self):
+    @pytest.mark.parametrize(
+        ("body", "data", "expected_body", "expected_method", "warns"),
+        [
+            pytest.param(b"body", _SIMPLE_DATA, b"body", "GET", True, id="body-data"),
+            pytest.param(b"", _SIMPLE_DATA, b"", "GET", True, id="empty-body-data"),
+            pytest.param(
+                None, _SIMPLE_DATA, _SIMPLE_DATA_BODY, "POST", False, id="data-only"
+            ),
+            pytest.param(None, None, b"", "GET", False, id="neither"),
+        ],
+    )
+    def test_body_data_matrix(self, body, data, expected_body, expected_method, warns):
+        """Passing any body value together with data should warn and ignore
+        the data; otherwise no warning is emitted."""
+        if warns:
+            with pytest.warns(UserWarning, match="data will be ignored"):
+                r = self.request_class(
+                    url="http://www.example.com/", body=body, data=data
+                )
+        else:
+            with warnings.catch_warnings():
+                warnings.filterwarnings(
+                    "error", category=UserWarning, message="Both body and data passed"
+                )
+                r = self.request_class(
+                    url="http://www.example.com/", body=body, data=data
+                )
+        assert r.body == expected_body
+        assert r.method == expected_method
+
+    @pytest.fixture
+    def dumps_kwargs_spy(self, monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
+        """Record the keyword arguments of the last json.dumps() call,
+        without the call machinery of a MagicMock."""
+        captured: dict[str, Any] = {}
+
+        def spy(obj: Any, **kwargs: Any) -> str:
+            captured.clear()
+            captured.update(kwargs)
+            return ""
+
+        monkeypatch.setattr(json, "dumps", spy)
+        return captured
+
+    def test_dumps_sort_keys(self, dumps_kwargs_spy):
         """Test that sort_keys=True is passed to json.dumps by default"""
-        data = {
-            "name": "value",
-        }
-        with mock.patch("json.dumps", return_value=b"") as mock_dumps:
-            self.request_class(url="http://www.example.com/", data=data)
-            kwargs = mock_dumps.call_args[1]
-            assert kwargs["sort_keys"] is True
-
-    def test_dumps_kwargs(self):
+        self.request_class(url="http://www.example.com/", data=_SIMPLE_DATA)
+        assert dumps_kwargs_spy["sort_keys"] is True
+
+    def test_dumps_kwargs(self, dumps_kwargs_spy):
         """Test that dumps_kwargs are passed to json.dumps"""
-        data = {
-            "name": "value",
-        }
-        dumps_kwargs = {
-            "ensure_ascii": True,
-            "allow_nan": True,
-        }
-        with mock.patch("json.dumps", return_value=b"") as mock_dumps:
-            self.request_class(
-                url="http://www.example.com/", data=data, dumps_kwargs=dumps_kwargs
-            )
-            kwargs = mock_dumps.call_args[1]
-            assert kwargs["ensure_ascii"] is True
-            assert kwargs["allow_nan"] is True
+        self.request_class(
+            url="http://www.example.com/",
+            data=_SIMPLE_DATA,
+            dumps_kwargs=_DUMPS_KWARGS,
+        )
+        assert dumps_kwargs_spy["ensure_ascii"] is True
+        assert dumps_kwargs_spy["allow_nan"] is True
 
     def test_replace_data(self):
-        data1 = {
-            "name1": "value1",
-        }
-        data2 = {
-            "name2": "value2",
-        }
-        r1 = self.request_class(url="http://www.example.com/", data=data1)
-        r2 = r1.replace(data=data2)
-        assert r2.body == to_bytes(json.dumps(data2))
-
-    def test_replace_sort_keys(self):
+        r1 = self.request_class(url="http://www.example.com/", data=_DATA1)
+        r2 = r1.replace(data=_DATA2)
+        assert json.loads(r2.body) == _DATA2
+
+    def test_replace_sort_keys(self, dumps_kwargs_spy):
         """Test that replace provides sort_keys=True to json.dumps"""
-        data1 = {
-            "name1": "value1",
-        }
-        data2 = {
-            "name2": "value2",
-        }
-        r1 = self.request_class(url="http://www.example.com/", data=data1)
-        with mock.patch("json.dumps", return_value=b"") as mock_dumps:
-            r1.replace(data=data2)
-            kwargs = mock_dumps.call_args[1]
-            assert kwargs["sort_keys"] is True
-
-    def test_replace_dumps_kwargs(self):
+        r1 = self.request_class(url="http://www.example.com/", data=_DATA1)
+        r1.replace(data=_DATA2)
+        assert dumps_kwargs_spy["sort_keys"] is True
+
+    def test_replace_dumps_kwargs(self, dumps_kwargs_spy):
         """Test that dumps_kwargs are provided to json.dumps when replace is called"""
-        data1 = {
-            "name1": "value1",
-        }
-        data2 = {
-            "name2": "value2",
-        }
-        dumps_kwargs = {
-            "ensure_ascii": True,
-            "allow_nan": True,
-        }
         r1 = self.request_class(
-            url="http://www.example.com/", data=data1, dumps_kwargs=dumps_kwargs
+            url="http://www.example.com/", data=_DATA1, dumps_kwargs=_DUMPS_KWARGS
         )
-        with mock.patch("json.dumps", return_value=b"") as mock_dumps:
-            r1.replace(data=data2)
-            kwargs = mock_dumps.call_args[1]
-            assert kwargs["ensure_ascii"] is True
-            assert kwargs["allow_nan"] is True
+        r1.replace(data=_DATA2)
+        assert dumps_kwargs_spy["ensure_ascii"] is True
+        assert dumps_kwargs_spy["allow_nan"] is True
 
     def test_replacement_both_body_and_data_warns(self):
         """Test that we get a warning if both body and data are passed"""
-        body1 = None
-        body2 = b"body"
-        data1 = {
-            "name1": "value1",
-        }
-        data2 = {
-            "name2": "value2",
-        }
-        r1 = self.request_class(url="http://www.example.com/", data=data1, body=body1)
+        r1 = self.request_class(url="http://www.example.com/", data=_DATA1, body=None)
 
         with pytest.warns(UserWarning, match="data will be ignored"):
-            r1.replace(data=data2, body=body2)
+            r1.replace(data=_DATA2, body=b"body")